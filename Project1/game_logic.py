@@ -2,18 +2,47 @@
 
 from __future__ import annotations
 
+import bisect
 import json
 import math
+import os
 import random
 import time
-from dataclasses import dataclass, asdict
+from collections import deque
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Deque, Dict, Iterator, List, Optional, Tuple
 
 import yaml
 
-
-@dataclass
+try:
+    import orjson
+except ImportError:  # orjson is an optional accelerator; stdlib json is the fallback
+    orjson = None
+
+# Integer tile codes used by the simulation. The renderer still receives the
+# string names from ``TILE_NAMES``; codes index into that tuple.
+TILE_NAMES = (
+    "floor",
+    "wall",
+    "rock",
+    "pit",
+    "spikes",
+    "door_up",
+    "door_down",
+    "door_left",
+    "door_right",
+)
+TILE_CODES = {name: code for code, name in enumerate(TILE_NAMES)}
+
+SOLID_TILES = frozenset({"wall", "rock", "pit"})
+HAZARD_TILES = frozenset({"spikes"})
+# Bit ``1 << code`` is set for every tile code in the matching set.
+SOLID_MASK = sum(1 << TILE_CODES[name] for name in SOLID_TILES)
+HAZARD_MASK = sum(1 << TILE_CODES[name] for name in HAZARD_TILES)
+
+
+@dataclass(slots=True)
 class Actor:
     id: str
     kind: str
@@ -30,7 +59,7 @@ class Actor:
     invulnerability: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class Projectile:
     id: str
     owner: str
@@ -44,7 +73,7 @@ class Projectile:
     radius: float = 0.2
 
 
-@dataclass
+@dataclass(slots=True)
 class Pickup:
     id: str
     kind: str
@@ -52,7 +81,7 @@ class Pickup:
     y: float
 
 
-@dataclass
+@dataclass(slots=True)
 class Effect:
     id: str
     kind: str
@@ -64,8 +93,16 @@ class Effect:
 class RogueGame:
     """Main gameplay loop that mirrors classic Isaac-style mechanics."""
 
-    SOLID_TILES = {"wall", "rock", "pit"}
-    HAZARD_TILES = {"spikes"}
+    # Cumulative interior roll thresholds and the tile each band produces.
+    OBSTACLE_THRESHOLDS = (0.06, 0.1, 0.14)
+    OBSTACLE_TILES = ("rock", "pit", "spikes", "floor")
+    # Squared player reach for collecting pickups (0.75 tiles).
+    PICKUP_RADIUS_SQ = 0.75 * 0.75
+    # Number of recent messages kept for the HUD.
+    MESSAGE_HISTORY = 4
+    # Upper bound on ticks simulated in one frame after a stall, so a long
+    # hitch does not snowball into ever longer catch-up frames.
+    MAX_CATCH_UP_STEPS = 5
 
     def __init__(self, config_path: str = "game_config.yaml", shared_dir: str = "shared") -> None:
         self.config_path = Path(config_path)
@@ -84,6 +121,63 @@ class RogueGame:
         self.player_radius = 0.35
         self.enemy_radius = 0.45
 
+        # Tuning values read on hot paths, coerced once up front.
+        player_cfg = self.config["player"]
+        self.fire_delay = float(player_cfg["fire_delay"])
+        self.projectile_speed = float(player_cfg["projectile_speed"])
+        self.projectile_damage = int(player_cfg["projectile_damage"])
+
+        enemy_cfg = self.config["enemies"]
+        self.enemy_variants = list(enemy_cfg["variants"])
+        self.enemy_spawn_range = (int(enemy_cfg["spawn_min"]), int(enemy_cfg["spawn_max"]))
+        self.enemy_hp_range = (int(enemy_cfg["hp_min"]), int(enemy_cfg["hp_max"]))
+        self.enemy_speed_range = (float(enemy_cfg["speed_min"]), float(enemy_cfg["speed_max"]))
+
+        # Cumulative drop thresholds; any roll past the last one is a bomb.
+        pickup_cfg = self.config["pickups"]
+        self._pickup_kinds = ("heart", "coin", "key", "bomb")
+        self._pickup_thresholds: List[float] = []
+        cumulative = 0.0
+        for kind in self._pickup_kinds[:-1]:
+            cumulative += float(pickup_cfg[f"chance_{kind}"])
+            self._pickup_thresholds.append(cumulative)
+
+        # Retired projectiles and effects, recycled instead of reallocated.
+        self._projectile_pool: List[Projectile] = []
+        self._effect_pool: List[Effect] = []
+
+        # Persistent snapshot containers, refreshed in place every tick rather
+        # than rebuilt; see _refresh_meta and serialise_state.
+        self.meta: Dict = {
+            "tick": 0,
+            "delta_time": self.delta_time,
+            "room_id": 0,
+            "player_hp": 0,
+            "player_max_hp": 0,
+            "coins": 0,
+            "keys": 0,
+            "bombs": 0,
+            "rng_seed": self.config["game"].get("rng_seed"),
+            "room_cleared": False,
+            "messages": [],
+            "player_dead": False,
+        }
+        self._state: Dict = {
+            "meta": self.meta,
+            "actors": [],
+            "projectiles": [],
+            "pickups": [],
+            "effects": [],
+            "ui": {
+                "messages": self.meta["messages"],
+                "boss_health": None,
+            },
+        }
+
+        # Last parsed input and the (mtime, size) stamp it was read at.
+        self._latest_input: Dict = {}
+        self._input_stamp: Optional[Tuple[int, int]] = None
+
         self._reset_run()
 
     # ------------------------------------------------------------------
@@ -141,7 +235,9 @@ class RogueGame:
     def _reset_run(self) -> None:
         self.tick = 0
         self.inventory = {"coins": 0, "keys": 0, "bombs": 1}
-        self.messages: List[str] = []
+        # Only the most recent messages are ever shown, so older ones are
+        # dropped as new ones arrive.
+        self.messages: Deque[str] = deque(maxlen=self.MESSAGE_HISTORY)
 
         self.room = self._generate_room()
         spawn_x = self.room["width"] / 2.0
@@ -159,12 +255,14 @@ class RogueGame:
         )
 
         self.enemies: List[Actor] = self._spawn_enemies()
+        self._rebuild_enemy_grid()
         self.projectiles: List[Projectile] = []
         self.pickups: List[Pickup] = self._spawn_pickups()
         self.effects: List[Effect] = []
 
         self.running = True
         self._refresh_meta()
+        self.write_room()
 
     def _generate_room(self) -> Dict:
         width = int(self.config["game"]["room_width"])
@@ -185,15 +283,37 @@ class RogueGame:
         tiles[height // 2][0] = "door_left"
         tiles[height // 2][width - 1] = "door_right"
 
+        # One roll per interior tile, drawn row-major as before so seeded
+        # layouts are unchanged; each row is filled in a single slice.
+        roll = self.rng.random
+        thresholds = self.OBSTACLE_THRESHOLDS
+        obstacles = self.OBSTACLE_TILES
         for y in range(1, height - 1):
-            for x in range(1, width - 1):
-                roll = self.rng.random()
-                if roll < 0.06:
-                    tiles[y][x] = "rock"
-                elif roll < 0.1:
-                    tiles[y][x] = "pit"
-                elif roll < 0.14:
-                    tiles[y][x] = "spikes"
+            tiles[y][1 : width - 1] = [
+                obstacles[bisect.bisect_right(thresholds, roll())] for _ in range(width - 2)
+            ]
+
+        # Flat row-major copy of the layout for the hot lookups, plus a
+        # per-tile solidity flag. The layout is static for the lifetime of
+        # the room, so both are only rebuilt when a new room is generated.
+        self.tile_codes = bytearray(TILE_CODES[tile] for row in tiles for tile in row)
+
+        # The solidity flags are framed by a solid border at least as thick
+        # as the furthest any actor can move in one tick. A sample just
+        # outside the room (e.g. walking through a door) then lands on a
+        # blocking cell without any bounds clamping. Cell (x, y) lives at
+        # (floor(y) + border) * stride + floor(x) + border.
+        max_speed = max(float(self.config["player"]["speed"]), *self.enemy_speed_range)
+        border = max(1, math.ceil(max_speed * self.delta_time))
+        stride = width + 2 * border
+        solid = bytearray(b"\x01") * (stride * (height + 2 * border))
+        for y in range(height):
+            row = self.tile_codes[y * width : (y + 1) * width]
+            start = (y + border) * stride + border
+            solid[start : start + width] = bytes((1 << code) & SOLID_MASK != 0 for code in row)
+        self.solid = solid
+        self._solid_border = border
+        self._solid_stride = stride
 
         return {
             "width": width,
@@ -203,9 +323,7 @@ class RogueGame:
         }
 
     def _spawn_enemies(self) -> List[Actor]:
-        count = self.rng.randint(
-            int(self.config["enemies"]["spawn_min"]), int(self.config["enemies"]["spawn_max"])
-        )
+        count = self.rng.randint(*self.enemy_spawn_range)
 
         enemies: List[Actor] = []
         for index in range(count):
@@ -218,9 +336,9 @@ class RogueGame:
                 x = self.room["width"] / 2.0
                 y = 2.0
 
-            variant = self.rng.choice(self.config["enemies"]["variants"])
-            hp = self.rng.randint(int(self.config["enemies"]["hp_min"]), int(self.config["enemies"]["hp_max"]))
-            speed = self.rng.uniform(float(self.config["enemies"]["speed_min"]), float(self.config["enemies"]["speed_max"]))
+            variant = self.rng.choice(self.enemy_variants)
+            hp = self.rng.randint(*self.enemy_hp_range)
+            speed = self.rng.uniform(*self.enemy_speed_range)
 
             enemies.append(
                 Actor(
@@ -248,16 +366,7 @@ class RogueGame:
         return pickups
 
     def _roll_pickup_kind(self) -> str:
-        roll = self.rng.random()
-        if roll < self.config["pickups"]["chance_heart"]:
-            return "heart"
-        roll -= self.config["pickups"]["chance_heart"]
-        if roll < self.config["pickups"]["chance_coin"]:
-            return "coin"
-        roll -= self.config["pickups"]["chance_coin"]
-        if roll < self.config["pickups"]["chance_key"]:
-            return "key"
-        return "bomb"
+        return self._pickup_kinds[bisect.bisect_right(self._pickup_thresholds, self.rng.random())]
 
     # ------------------------------------------------------------------
     # Simulation update
@@ -297,51 +406,107 @@ class RogueGame:
         self.player.attack_cooldown = max(0.0, self.player.attack_cooldown - dt)
         if attack_dir != (0.0, 0.0) and self.player.attack_cooldown <= 0.0:
             self._spawn_player_projectile(attack_dir)
-            self.player.attack_cooldown = float(self.config["player"]["fire_delay"])
+            self.player.attack_cooldown = self.fire_delay
 
         # Hazards
-        tile_under = self._tile_at(self.player.x, self.player.y)
-        if tile_under in self.HAZARD_TILES and self.player.invulnerability <= 0.0:
+        tile_under = self._tile_code_at(self.player.x, self.player.y)
+        if (1 << tile_under) & HAZARD_MASK and self.player.invulnerability <= 0.0:
             self._damage_player(1, source="spikes")
             self.player.invulnerability = 0.75
 
         self.player.invulnerability = max(0.0, self.player.invulnerability - dt)
 
     def _move_actor(self, actor: Actor, radius: float, dt: float) -> None:
-        desired_x = actor.x + actor.vx * dt
-        desired_y = actor.y + actor.vy * dt
-
-        if self._is_position_walkable(desired_x, actor.y, radius):
-            actor.x = desired_x
-        else:
-            actor.vx = 0.0
+        # A zero velocity leaves that axis untouched whatever the probe says,
+        # so stationary axes skip the walkability test entirely.
+        walkable = self._is_position_walkable
+        x = actor.x
+        y = actor.y
+
+        if actor.vx:
+            desired_x = x + actor.vx * dt
+            if walkable(desired_x, y, radius):
+                actor.x = x = desired_x
+            else:
+                actor.vx = 0.0
 
-        if self._is_position_walkable(actor.x, desired_y, radius):
-            actor.y = desired_y
-        else:
-            actor.vy = 0.0
+        if actor.vy:
+            desired_y = y + actor.vy * dt
+            if walkable(x, desired_y, radius):
+                actor.y = desired_y
+            else:
+                actor.vy = 0.0
 
     def _spawn_player_projectile(self, direction: Tuple[float, float]) -> None:
-        proj_speed = float(self.config["player"]["projectile_speed"])
-        damage = int(self.config["player"]["projectile_damage"])
-        projectile = Projectile(
-            id=f"tear_{self.tick}_{len(self.projectiles)}",
+        proj_speed = self.projectile_speed
+        self._spawn_projectile(
+            entity_id=f"tear_{self.tick}_{len(self.projectiles)}",
             owner="player",
             kind="player_projectile",
             x=self.player.x,
             y=self.player.y,
             vx=direction[0] * proj_speed,
             vy=direction[1] * proj_speed,
-            damage=damage,
+            damage=self.projectile_damage,
             ttl=2.0,
         )
+
+    def _spawn_projectile(
+        self,
+        entity_id: str,
+        owner: str,
+        kind: str,
+        x: float,
+        y: float,
+        vx: float,
+        vy: float,
+        damage: int,
+        ttl: float,
+        radius: float = 0.2,
+    ) -> None:
+        if not self._projectile_pool:
+            self.projectiles.append(Projectile(entity_id, owner, kind, x, y, vx, vy, damage, ttl, radius))
+            return
+        projectile = self._projectile_pool.pop()
+        projectile.id = entity_id
+        projectile.owner = owner
+        projectile.kind = kind
+        projectile.x = x
+        projectile.y = y
+        projectile.vx = vx
+        projectile.vy = vy
+        projectile.damage = damage
+        projectile.ttl = ttl
+        projectile.radius = radius
         self.projectiles.append(projectile)
 
+    def _spawn_effect(self, entity_id: str, kind: str, x: float, y: float, ttl: float) -> None:
+        if not self._effect_pool:
+            self.effects.append(Effect(entity_id, kind, x, y, ttl))
+            return
+        effect = self._effect_pool.pop()
+        effect.id = entity_id
+        effect.kind = kind
+        effect.x = x
+        effect.y = y
+        effect.ttl = ttl
+        self.effects.append(effect)
+
     def _update_enemies(self, dt: float) -> None:
-        for enemy in list(self.enemies):
-            dx = self.player.x - enemy.x
-            dy = self.player.y - enemy.y
-            dist = math.hypot(dx, dy)
+        # Loop-invariant lookups are bound to locals so the per-enemy body
+        # only touches the enemy's own attributes.
+        player_x = self.player.x
+        player_y = self.player.y
+        radius = self.enemy_radius
+        hypot = math.hypot
+        dead: List[Actor] = []
+        for enemy in self.enemies:
+            dx = player_x - enemy.x
+            dy = player_y - enemy.y
+            # The distance normalises the steering vector as well as gating
+            # the attack, so a squared-distance range prefilter would not
+            # save this square root.
+            dist = hypot(dx, dy)
 
             if dist > 0.01:
                 enemy.vx = (dx / dist) * enemy.speed
@@ -349,7 +514,7 @@ class RogueGame:
             else:
                 enemy.vx = enemy.vy = 0.0
 
-            self._move_actor(enemy, self.enemy_radius, dt)
+            self._move_actor(enemy, radius, dt)
 
             enemy.attack_cooldown = max(0.0, enemy.attack_cooldown - dt)
             if dist < 1.0 and enemy.attack_cooldown <= 0.0:
@@ -357,66 +522,118 @@ class RogueGame:
                 enemy.attack_cooldown = 0.8
 
             if enemy.hp <= 0:
-                self.enemies.remove(enemy)
+                dead.append(enemy)
+
+        # Cull after the pass instead of removing mid-iteration, which needed
+        # a defensive copy of the list and an O(n) search per death.
+        if dead:
+            self.enemies = [enemy for enemy in self.enemies if enemy.hp > 0]
+            for enemy in dead:
                 self._on_enemy_death(enemy)
 
+        self._rebuild_enemy_grid()
+
+    def _rebuild_enemy_grid(self) -> None:
+        """Bucket enemy list indices by tile for neighbourhood queries."""
+        grid: Dict[Tuple[int, int], List[int]] = {}
+        for index, enemy in enumerate(self.enemies):
+            grid.setdefault((int(enemy.x), int(enemy.y)), []).append(index)
+        self._enemy_grid = grid
+
     def _update_projectiles(self, dt: float) -> None:
         next_projectiles: List[Projectile] = []
+        retire = self._projectile_pool.append
+        solid_at = self._solid_at
         for projectile in self.projectiles:
-            projectile.x += projectile.vx * dt
-            projectile.y += projectile.vy * dt
+            x = projectile.x = projectile.x + projectile.vx * dt
+            y = projectile.y = projectile.y + projectile.vy * dt
             projectile.ttl -= dt
 
             if projectile.ttl <= 0:
+                retire(projectile)
                 continue
 
-            tile = self._tile_at(projectile.x, projectile.y)
-            if tile in self.SOLID_TILES:
-                self.effects.append(
-                    Effect(
-                        id=f"impact_{projectile.id}",
-                        kind="impact",
-                        x=projectile.x,
-                        y=projectile.y,
-                        ttl=0.2,
-                    )
+            if solid_at(x, y):
+                self._spawn_effect(
+                    entity_id=f"impact_{projectile.id}",
+                    kind="impact",
+                    x=x,
+                    y=y,
+                    ttl=0.2,
                 )
+                retire(projectile)
                 continue
 
             if projectile.owner == "player":
-                hit_enemy = self._check_enemy_hit(projectile)
-                if hit_enemy:
-                    continue
+                hit = self._check_enemy_hit(projectile)
             else:
-                if self._check_player_hit(projectile):
-                    continue
+                hit = self._check_player_hit(projectile)
+            if hit:
+                retire(projectile)
+                continue
 
             next_projectiles.append(projectile)
 
         self.projectiles = next_projectiles
 
     def _check_enemy_hit(self, projectile: Projectile) -> bool:
-        for enemy in self.enemies:
-            if self._distance(enemy.x, enemy.y, projectile.x, projectile.y) < (self.enemy_radius + projectile.radius):
-                enemy.hp -= projectile.damage
-                self.effects.append(
-                    Effect(
-                        id=f"blood_{enemy.id}_{self.tick}",
-                        kind="blood_splatter",
-                        x=projectile.x,
-                        y=projectile.y,
-                        ttl=0.4,
-                    )
-                )
-                if enemy.hp <= 0:
-                    self.messages.append(f"{enemy.variant.title()} defeated!")
-                return True
-        return False
+        px = projectile.x
+        py = projectile.y
+        reach = self.enemy_radius + projectile.radius
+        reach_sq = reach * reach
+        enemies = self.enemies
+        # A shot overlapping several enemies hits the earliest one in the
+        # enemy list, whatever order the grid buckets are visited in.
+        target = -1
+        for index in self._nearby_enemy_indices(px, py):
+            if 0 <= target < index:
+                continue
+            enemy = enemies[index]
+            dx = enemy.x - px
+            if dx > reach or dx < -reach:
+                continue
+            dy = enemy.y - py
+            if dy > reach or dy < -reach:
+                continue
+            if dx * dx + dy * dy < reach_sq:
+                target = index
+
+        if target < 0:
+            return False
+
+        enemy = enemies[target]
+        enemy.hp -= projectile.damage
+        self._spawn_effect(
+            entity_id=f"blood_{enemy.id}_{self.tick}",
+            kind="blood_splatter",
+            x=px,
+            y=py,
+            ttl=0.4,
+        )
+        if enemy.hp <= 0:
+            self.messages.append(f"{enemy.variant.title()} defeated!")
+        return True
+
+    def _nearby_enemy_indices(self, x: float, y: float) -> Iterator[int]:
+        """Yield indices of enemies bucketed in the 3x3 tiles around ``(x, y)``.
+
+        Hit reach stays below one tile, so anything further away cannot
+        collide and is never visited.
+        """
+        grid = self._enemy_grid
+        cx = int(x)
+        cy = int(y)
+        for gy in (cy - 1, cy, cy + 1):
+            for gx in (cx - 1, cx, cx + 1):
+                bucket = grid.get((gx, gy))
+                if bucket:
+                    yield from bucket
 
     def _check_player_hit(self, projectile: Projectile) -> bool:
         if self.player.invulnerability > 0.0:
             return False
-        if self._distance(self.player.x, self.player.y, projectile.x, projectile.y) < (self.player_radius + projectile.radius):
+        reach = self.player_radius + projectile.radius
+        if self._distance_sq(self.player.x, self.player.y, projectile.x, projectile.y) < reach * reach:
             self._damage_player(1, source="projectile")
             return True
         return False
@@ -424,7 +641,7 @@ class RogueGame:
     def _handle_pickups(self) -> None:
         remaining: List[Pickup] = []
         for pickup in self.pickups:
-            if self._distance(self.player.x, self.player.y, pickup.x, pickup.y) < 0.75:
+            if self._distance_sq(self.player.x, self.player.y, pickup.x, pickup.y) < self.PICKUP_RADIUS_SQ:
                 self._apply_pickup(pickup)
             else:
                 remaining.append(pickup)
@@ -445,10 +662,13 @@ class RogueGame:
 
     def _update_effects(self, dt: float) -> None:
         remaining: List[Effect] = []
+        retire = self._effect_pool.append
         for effect in self.effects:
             effect.ttl -= dt
             if effect.ttl > 0:
                 remaining.append(effect)
+            else:
+                retire(effect)
         self.effects = remaining
 
     def _on_enemy_death(self, enemy: Actor) -> None:
@@ -460,38 +680,49 @@ class RogueGame:
     # Utility helpers
     # ------------------------------------------------------------------
     def _refresh_meta(self) -> None:
-        self.meta = {
-            "tick": self.tick,
-            "delta_time": self.delta_time,
-            "room_id": 0,
-            "player_hp": self.player.hp,
-            "player_max_hp": self.player.max_hp,
-            "coins": self.inventory["coins"],
-            "keys": self.inventory["keys"],
-            "bombs": self.inventory["bombs"],
-            "rng_seed": self.config["game"].get("rng_seed"),
-            "room_cleared": not self.enemies,
-            "messages": self.messages[-4:],
-            "player_dead": self.player.hp <= 0,
-        }
-
-    def _tile_at(self, x: float, y: float) -> str:
-        xi = max(0, min(self.room["width"] - 1, int(x)))
+        # self.meta is built once in __init__; only the per-tick keys are
+        # rewritten here.
+        meta = self.meta
+        meta["tick"] = self.tick
+        meta["player_hp"] = self.player.hp
+        meta["player_max_hp"] = self.player.max_hp
+        meta["coins"] = self.inventory["coins"]
+        meta["keys"] = self.inventory["keys"]
+        meta["bombs"] = self.inventory["bombs"]
+        meta["room_cleared"] = not self.enemies
+        meta["messages"][:] = self.messages
+        meta["player_dead"] = self.player.hp <= 0
+
+    def _tile_code_at(self, x: float, y: float) -> int:
+        width = self.room["width"]
+        xi = max(0, min(width - 1, int(x)))
         yi = max(0, min(self.room["height"] - 1, int(y)))
-        return self.room["tiles"][yi][xi]
+        return self.tile_codes[yi * width + xi]
+
+    def _solid_at(self, x: float, y: float) -> int:
+        # Projectiles can fly through doors, so clamp into the padded grid;
+        # everything beyond the border reads as solid.
+        border = self._solid_border
+        stride = self._solid_stride
+        xi = max(0, min(stride - 1, math.floor(x) + border))
+        yi = max(0, min(self.room["height"] + 2 * border - 1, math.floor(y) + border))
+        return self.solid[yi * stride + xi]
 
     def _is_position_walkable(self, x: float, y: float, radius: float) -> bool:
-        samples = [
-            (x - radius, y - radius),
-            (x + radius, y - radius),
-            (x - radius, y + radius),
-            (x + radius, y + radius),
-        ]
-        for sx, sy in samples:
-            tile = self._tile_at(sx, sy)
-            if tile in self.SOLID_TILES:
-                return False
-        return True
+        # The four corner samples share two columns and two rows. Actors only
+        # ever stand inside the room and the border is at least one tick of
+        # movement thick, so samples never leave the padded grid and need no
+        # clamping. floor() rather than int() keeps samples in (-1, 0) on the
+        # border instead of truncating them onto row or column 0.
+        floor = math.floor
+        border = self._solid_border
+        stride = self._solid_stride
+        left = floor(x - radius) + border
+        right = floor(x + radius) + border
+        top = (floor(y - radius) + border) * stride
+        bottom = (floor(y + radius) + border) * stride
+        solid = self.solid
+        return not (solid[top + left] or solid[top + right] or solid[bottom + left] or solid[bottom + right])
 
     def _damage_player(self, amount: int, source: str) -> None:
         if self.player.invulnerability > 0.0:
@@ -500,8 +731,12 @@ class RogueGame:
         self.player.invulnerability = 1.0
         self.messages.append(f"Took damage from {source}!")
 
-    def _distance(self, ax: float, ay: float, bx: float, by: float) -> float:
-        return math.hypot(ax - bx, ay - by)
+    def _distance_sq(self, ax: float, ay: float, bx: float, by: float) -> float:
+        # Range predicates compare against a squared radius instead of
+        # taking a square root.
+        dx = ax - bx
+        dy = ay - by
+        return dx * dx + dy * dy
 
     def _normalize_vector(self, data: Dict, normalize: bool = False) -> Tuple[float, float]:
         x = float(data.get("x", 0))
@@ -519,83 +754,176 @@ class RogueGame:
     # Serialisation
     # ------------------------------------------------------------------
     def serialise_state(self) -> Dict:
-        return {
-            "meta": self.meta,
-            "tilemap": self.room,
-            "actors": [
-                {
-                    "id": self.player.id,
-                    "type": self.player.kind,
-                    "variant": self.player.variant,
-                    "x": self.player.x,
-                    "y": self.player.y,
-                    "dir_x": math.copysign(1.0, self.player.vx) if abs(self.player.vx) > 0.1 else 0.0,
-                    "dir_y": math.copysign(1.0, self.player.vy) if abs(self.player.vy) > 0.1 else 0.0,
-                    "hp": self.player.hp,
-                    "max_hp": self.player.max_hp,
-                    "state": self.player.state,
-                    "speed": self.player.speed,
-                    "items": [],
-                    "invulnerable": self.player.invulnerability > 0.0,
-                }
-            ]
-            + [
-                {
-                    "id": enemy.id,
-                    "type": enemy.kind,
-                    "variant": enemy.variant,
-                    "x": enemy.x,
-                    "y": enemy.y,
-                    "hp": enemy.hp,
-                    "max_hp": enemy.max_hp,
-                    "state": enemy.state,
-                }
-                for enemy in self.enemies
-            ],
-            "projectiles": [asdict(p) for p in self.projectiles],
-            "pickups": [asdict(p) for p in self.pickups],
-            "effects": [asdict(e) for e in self.effects],
-            "ui": {
-                "messages": self.meta.get("messages", []),
-                "boss_health": None,
-            },
-        }
+        """Return the current snapshot.
+
+        The returned dict and its lists are reused from tick to tick, so it
+        must be encoded before the simulation advances again.
+        """
+        state = self._state
+        player = self.player
+
+        actors = state["actors"]
+        actors.clear()
+        actors.append(
+            {
+                "id": player.id,
+                "type": player.kind,
+                "variant": player.variant,
+                "x": player.x,
+                "y": player.y,
+                "dir_x": math.copysign(1.0, player.vx) if abs(player.vx) > 0.1 else 0.0,
+                "dir_y": math.copysign(1.0, player.vy) if abs(player.vy) > 0.1 else 0.0,
+                "hp": player.hp,
+                "max_hp": player.max_hp,
+                "state": player.state,
+                "speed": player.speed,
+                "items": [],
+                "invulnerable": player.invulnerability > 0.0,
+            }
+        )
+        actors.extend(
+            {
+                "id": enemy.id,
+                "type": enemy.kind,
+                "variant": enemy.variant,
+                "x": enemy.x,
+                "y": enemy.y,
+                "hp": enemy.hp,
+                "max_hp": enemy.max_hp,
+                "state": enemy.state,
+            }
+            for enemy in self.enemies
+        )
+
+        # Field-by-field literals; dataclasses.asdict deep-copies each
+        # value through a recursive walk, which adds up at tick rate.
+        projectiles = state["projectiles"]
+        projectiles.clear()
+        projectiles.extend(
+            {
+                "id": p.id,
+                "owner": p.owner,
+                "kind": p.kind,
+                "x": p.x,
+                "y": p.y,
+                "vx": p.vx,
+                "vy": p.vy,
+                "damage": p.damage,
+                "ttl": p.ttl,
+                "radius": p.radius,
+            }
+            for p in self.projectiles
+        )
+
+        pickups = state["pickups"]
+        pickups.clear()
+        pickups.extend({"id": p.id, "kind": p.kind, "x": p.x, "y": p.y} for p in self.pickups)
+
+        effects = state["effects"]
+        effects.clear()
+        effects.extend({"id": e.id, "kind": e.kind, "x": e.x, "y": e.y, "ttl": e.ttl} for e in self.effects)
+
+        return state
+
+    def write_room(self) -> None:
+        """Publish the static tilemap; it only changes when a room is generated."""
+        # Unlike snapshots, the room is written once, so a failed swap is
+        # retried from write_state until it lands.
+        self._room_pending = not self._write_json(self.shared_dir / "room.json", self.room)
 
     def write_state(self) -> None:
-        state_path = self.shared_dir / "game_state.json"
-        with state_path.open("w", encoding="utf-8") as fh:
-            json.dump(self.serialise_state(), fh, indent=2)
+        if self._room_pending:
+            self.write_room()
+        # A snapshot that fails to land is simply superseded by the next one.
+        self._write_json(self.shared_dir / "game_state.json", self.serialise_state())
+
+    def _write_json(self, path: Path, payload: Dict) -> bool:
+        """Atomically replace ``path``; return False if the swap was refused."""
+        # Write next to the target and swap it in so the renderer never
+        # observes a half-written file.
+        tmp_path = path.with_suffix(".tmp")
+        with tmp_path.open("wb") as fh:
+            fh.write(_dump_json(payload))
+        try:
+            os.replace(tmp_path, path)
+        except PermissionError:
+            # Windows refuses the swap while the renderer has the file open.
+            return False
+        return True
 
     def read_input(self) -> Dict:
+        """Return the renderer's latest input, re-parsing only when the file changes."""
         input_path = self.shared_dir / "input.json"
-        if not input_path.exists():
+        try:
+            stat = os.stat(input_path)
+        except FileNotFoundError:
+            self._latest_input = {}
+            self._input_stamp = None
             return {}
+
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if stamp == self._input_stamp:
+            return self._latest_input
+
+        data = None
         try:
-            with input_path.open("r", encoding="utf-8") as fh:
-                data = json.load(fh)
-                if isinstance(data, dict):
-                    return data
-        except json.JSONDecodeError:
+            with input_path.open("rb") as fh:
+                data = _load_json(fh.read())
+        except (OSError, json.JSONDecodeError):
+            # Most likely caught mid-write; leave the stamp unset so the next
+            # tick reads the file again.
             pass
-        return {}
+        if not isinstance(data, dict):
+            self._input_stamp = None
+            return {}
+
+        self._latest_input = data
+        self._input_stamp = stamp
+        return data
 
     # ------------------------------------------------------------------
     # Main loop
     # ------------------------------------------------------------------
     def run(self) -> None:
+        # Fixed-timestep loop: wall time accumulates and is consumed in whole
+        # ticks, so a slow frame is caught up with extra steps instead of
+        # slowing the simulation down.
+        dt = self.delta_time
+        max_backlog = dt * self.MAX_CATCH_UP_STEPS
+        accumulator = 0.0
+        last = time.perf_counter()
         try:
             while self.running:
-                start = time.perf_counter()
-                inputs = self.read_input()
-                self.step(inputs)
-                self.write_state()
-                elapsed = time.perf_counter() - start
-                sleep_time = max(0.0, self.delta_time - elapsed)
-                time.sleep(sleep_time)
+                now = time.perf_counter()
+                accumulator = min(accumulator + (now - last), max_backlog)
+                last = now
+
+                if accumulator >= dt:
+                    inputs = self.read_input()
+                    while accumulator >= dt and self.running:
+                        self.step(inputs)
+                        accumulator -= dt
+                    self.write_state()
+
+                time.sleep(max(0.0, dt - accumulator))
         except KeyboardInterrupt:
             self.running = False
 
 
+def _dump_json(payload: Dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+
+def _load_json(raw: bytes) -> object:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers
+    # handle both backends the same way.
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 def main() -> None:
     game = RogueGame()
     game.write_state()  # Initial snapshot for renderer start-up
@@ -31,6 +31,8 @@ void GameRenderer::EnsureSharedDirectory() {
 }
 
 void GameRenderer::UpdateFromPython() {
+    LoadRoom();
+
     const fs::path state_path = fs::path(shared_dir_) / "game_state.json";
     std::ifstream file(state_path);
     if (!file.is_open()) {
@@ -41,17 +43,39 @@ void GameRenderer::UpdateFromPython() {
         json state;
         file >> state;
         current_state_ = std::move(state);
-        if (current_state_.contains("tilemap")) {
-            const json& tilemap = current_state_["tilemap"];
-            tile_size_ = tilemap.value("tile_size", 32.0f);
-            room_width_ = tilemap.value("width", 0);
-            room_height_ = tilemap.value("height", 0);
-        }
     } catch (const std::exception& e) {
         TraceLog(LOG_WARNING, "Failed to parse game_state.json: %s", e.what());
     }
 }
 
+void GameRenderer::LoadRoom() {
+    // The tilemap is only rewritten when Python generates a new room, so
+    // re-parse it only when the file changes.
+    const fs::path room_path = fs::path(shared_dir_) / "room.json";
+    std::error_code ec;
+    const auto write_time = fs::last_write_time(room_path, ec);
+    if (ec || write_time == room_write_time_) {
+        return;
+    }
+
+    std::ifstream file(room_path);
+    if (!file.is_open()) {
+        return;
+    }
+
+    try {
+        json tilemap;
+        file >> tilemap;
+        tilemap_ = std::move(tilemap);
+        tile_size_ = tilemap_.value("tile_size", 32.0f);
+        room_width_ = tilemap_.value("width", 0);
+        room_height_ = tilemap_.value("height", 0);
+        room_write_time_ = write_time;
+    } catch (const std::exception& e) {
+        TraceLog(LOG_WARNING, "Failed to parse room.json: %s", e.what());
+    }
+}
+
 void GameRenderer::HandleInput() {
     Vector2 move{0.0f, 0.0f};
     if (IsKeyDown(KEY_W)) move.y -= 1.0f;
@@ -130,16 +154,11 @@ void GameRenderer::RenderFrame() {
 }
 
 void GameRenderer::DrawTilemap() {
-    if (!current_state_.contains("tilemap")) {
-        return;
-    }
-
-    const json& tilemap = current_state_["tilemap"];
-    if (!tilemap.contains("tiles")) {
+    if (!tilemap_.contains("tiles")) {
         return;
     }
 
-    const auto& tiles = tilemap["tiles"];
+    const auto& tiles = tilemap_["tiles"];
     const float offset_x = (GetScreenWidth() - room_width_ * tile_size_) * 0.5f;
     const float offset_y = (GetScreenHeight() - room_height_ * tile_size_) * 0.5f;
 
@@ -2,6 +2,7 @@
 #include "raylib.h"
 
 #include <nlohmann/json.hpp>
+#include <filesystem>
 #include <string>
 
 class GameRenderer {
@@ -16,6 +17,8 @@ public:
 
 private:
     nlohmann::json current_state_;
+    nlohmann::json tilemap_;
+    std::filesystem::file_time_type room_write_time_{};
     std::string shared_dir_ = "shared";
     float tile_size_ = 32.0f;
     int room_width_ = 0;
@@ -23,6 +26,7 @@ private:
     bool quit_requested_ = false;
 
     void EnsureSharedDirectory();
+    void LoadRoom();
     void WriteInput(const nlohmann::json& input);
     void DrawTilemap();
     void DrawPickups();